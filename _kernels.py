@@ -0,0 +1,69 @@
+"""
+Low-level volatility kernels operating on raw 2-D return arrays.
+
+These are compiled with numba when it is installed, which removes the pandas
+call overhead that dominates for small portfolios. Without numba, equivalent
+NumPy implementations are used. Inputs must not contain NaNs; float32 inputs
+are accumulated in float64.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # pragma: no cover - optional dependency
+    numba = None
+
+
+def _ann_vol_numpy(R: np.ndarray, trading_days: int) -> np.ndarray:
+    if R.shape[0] < 2:
+        return np.full(R.shape[1], np.nan)
+    return R.std(axis=0, ddof=1, dtype=np.float64) * np.sqrt(trading_days)
+
+
+def _port_vol_numpy(R: np.ndarray, w: np.ndarray, trading_days: int) -> float:
+    rp = R @ w
+    return float(np.sqrt(np.var(rp, ddof=1, dtype=np.float64) * trading_days))
+
+
+if numba is not None:
+
+    @numba.njit(cache=True, fastmath=True)
+    def _ann_vol(R, trading_days):
+        T, K = R.shape
+        if T < 2:
+            return np.full(K, np.nan)
+        # DataFrame.to_numpy() yields column-major (F-ordered) arrays, so walk
+        # each column contiguously
+        out = np.empty(K)
+        for k in range(K):
+            mean = 0.0
+            for t in range(T):
+                mean += R[t, k]
+            mean /= T
+            ss = 0.0
+            for t in range(T):
+                d = R[t, k] - mean
+                ss += d * d
+            out[k] = ss
+        return np.sqrt(out / (T - 1) * trading_days)
+
+    @numba.njit(cache=True, fastmath=True)
+    def _port_vol(R, w, trading_days):
+        T, K = R.shape
+        rp = np.zeros(T)
+        for k in range(K):
+            for t in range(T):
+                rp[t] += np.float64(R[t, k]) * w[k]
+        mean = rp.mean()
+        ss = 0.0
+        for t in range(T):
+            d = rp[t] - mean
+            ss += d * d
+        return np.sqrt(ss / (T - 1) * trading_days)
+
+else:  # pragma: no cover - exercised only without numba
+    _ann_vol = _ann_vol_numpy
+    _port_vol = _port_vol_numpy
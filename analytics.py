@@ -4,11 +4,26 @@ Analytical helpers for portfolio risk/return.
 
 from __future__ import annotations
 
-from typing import Iterable, Optional
+from collections import deque
+from typing import Deque, Iterable, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 
+from ._kernels import _ann_vol, _port_vol
+
+
+def _cov_posthoc(R: np.ndarray) -> np.ndarray:
+    """
+    Sample covariance of the columns of ``R`` via the post-hoc formula.
+
+    Avoids materialising a mean-centred copy of ``R``; use when the full
+    covariance matrix is needed rather than a single quadratic form.
+    """
+    T = R.shape[0]
+    mean = R.mean(axis=0, keepdims=True)
+    return (R.T @ R) / (T - 1) - (T / (T - 1)) * (mean.T @ mean)
+
 
 def compute_daily_returns(price_history: pd.DataFrame) -> pd.DataFrame:
     """
@@ -16,8 +31,16 @@ def compute_daily_returns(price_history: pd.DataFrame) -> pd.DataFrame:
     """
     if price_history.empty:
         return pd.DataFrame()
-    returns = price_history.sort_index().pct_change().dropna(how="all")
-    return returns
+    # yfinance already returns dates in order; only sort when needed
+    ph = price_history if price_history.index.is_monotonic_increasing else price_history.sort_index()
+    prices = ph.to_numpy(dtype=float)
+    returns = prices[1:] / prices[:-1] - 1.0
+    index = ph.index[1:]
+    # Rows with no returns at all can only arise from gaps in ragged histories
+    if np.isnan(prices).any():
+        has_data = ~np.isnan(returns).all(axis=1)
+        returns, index = returns[has_data], index[has_data]
+    return pd.DataFrame(returns, index=index, columns=ph.columns)
 
 
 def annualized_volatility(
@@ -29,27 +52,150 @@ def annualized_volatility(
     """
     if returns.empty:
         return pd.Series(dtype=float)
-    daily_vol = returns.std()
-    return daily_vol * np.sqrt(trading_days)
+    if returns.isna().to_numpy().any():
+        # Ragged histories: let pandas skip missing values per column
+        return returns.std() * np.sqrt(trading_days)
+    # Returns have little dynamic range; float32 halves memory traffic and the
+    # kernels still accumulate in float64
+    R = returns.to_numpy(dtype=np.float32)
+    return pd.Series(_ann_vol(R, trading_days), index=returns.columns)
 
 
 def portfolio_volatility(
     returns: pd.DataFrame,
     weights: Iterable[float],
     trading_days: int = 252,
+    method: str = "sample",
+    market_returns: Optional[pd.Series] = None,
 ) -> Optional[float]:
     """
     Compute annualized portfolio volatility given a return matrix and weights.
+
+    ``method="sample"`` uses the sample covariance of ``returns``;
+    ``method="factor"`` uses a single-index model against ``market_returns``
+    (see ``factor_covariance``), which scales linearly in the number of tickers.
     """
     if returns.empty:
         return None
-    w = np.array(list(weights), dtype=float)
+    w = np.asarray(list(weights), dtype=float)
     if returns.shape[1] != len(w):
         raise ValueError("Number of weights must match number of columns in returns.")
-    cov = returns.cov()
-    daily_var = float(np.dot(w.T, np.dot(cov.values, w)))
-    if daily_var < 0:
+    if method == "factor":
+        if market_returns is None:
+            raise ValueError("market_returns is required when method='factor'.")
+        beta, sigma2_m, D = factor_covariance(returns, market_returns)
+        return portfolio_volatility_factor(beta, sigma2_m, D, w, trading_days=trading_days)
+    if method != "sample":
+        raise ValueError(f"Unknown method: {method!r}")
+    if returns.isna().to_numpy().any():
+        # Ragged histories: pairwise-complete covariance, as pandas computes it
+        daily_var = float(w @ returns.cov().to_numpy() @ w)
+        if not np.isfinite(daily_var) or daily_var < 0:
+            return None
+        return float(np.sqrt(daily_var * trading_days))
+    R = returns.to_numpy(dtype=np.float32)
+    if R.shape[0] < 2:
         return None
-    return float(np.sqrt(daily_var) * np.sqrt(trading_days))
+    return float(_port_vol(R, w.astype(np.float32), trading_days))
+
+
+def factor_covariance(
+    returns: pd.DataFrame,
+    market_returns: pd.Series,
+) -> Tuple[pd.Series, float, pd.Series]:
+    """
+    Fit a single-index model ``Σ ≈ β βᵀ σ²_m + diag(D)`` to a return matrix.
+
+    Returns per-ticker betas, the market variance and per-ticker residual
+    variances. Only dates where every ticker and the market have a return
+    are used.
+    """
+    joined = returns.join(market_returns.rename("__market__"), how="inner").dropna()
+    R = joined[returns.columns].to_numpy(dtype=float)
+    M = joined["__market__"].to_numpy(dtype=float)
+    if R.shape[0] < 3:
+        raise ValueError("At least three overlapping observations are required.")
+    Rc = R - R.mean(axis=0)
+    Mc = M - M.mean()
+    mm = Mc @ Mc
+    beta = (Rc.T @ Mc) / mm
+    resid = Rc - np.outer(Mc, beta)
+    D = resid.var(axis=0, ddof=1)
+    sigma2_m = float(mm / (len(M) - 1))
+    return pd.Series(beta, index=returns.columns), sigma2_m, pd.Series(D, index=returns.columns)
+
+
+def portfolio_volatility_factor(
+    beta: Iterable[float],
+    sigma2_m: float,
+    D: Iterable[float],
+    weights: Iterable[float],
+    trading_days: int = 252,
+) -> float:
+    """
+    Annualized portfolio volatility under a single-index covariance model.
+
+    ``wᵀ Σ w`` collapses to ``(βᵀw)² σ²_m + Σ wᵢ² dᵢ``, which is O(K).
+    """
+    beta = np.asarray(beta, dtype=float)
+    D = np.asarray(D, dtype=float)
+    w = np.asarray(list(weights), dtype=float)
+    daily_var = (beta @ w) ** 2 * sigma2_m + (w**2) @ D
+    return float(np.sqrt(daily_var * trading_days))
+
+
+class RollingCovariance:
+    """
+    Sample covariance over a sliding window of return observations.
+
+    Each ``update`` is a rank-1 add/drop of running sums, so advancing the
+    window by one day costs O(K^2) instead of recomputing over all M rows.
+    """
+
+    def __init__(self, n_assets: int, window: int = 252) -> None:
+        if window < 2:
+            raise ValueError("Window must contain at least two observations.")
+        self.window = window
+        self._buffer: Deque[np.ndarray] = deque()
+        self._sum = np.zeros(n_assets)
+        self._cross = np.zeros((n_assets, n_assets))
+
+    @classmethod
+    def from_returns(cls, returns: pd.DataFrame, window: int = 252) -> "RollingCovariance":
+        """
+        Seed a rolling covariance with the last ``window`` complete rows of returns.
+        """
+        rc = cls(returns.shape[1], window=window)
+        for r in returns.dropna().to_numpy(dtype=float)[-window:]:
+            rc.update(r)
+        return rc
+
+    def update(self, r: Iterable[float]) -> None:
+        """
+        Add one day of returns, dropping the oldest day once the window is full.
+
+        Rows must be finite: a NaN would poison the running sums permanently.
+        """
+        r = np.asarray(r, dtype=float)
+        if r.shape != self._sum.shape:
+            raise ValueError(f"Expected {self._sum.shape[0]} returns, got shape {r.shape}.")
+        if not np.isfinite(r).all():
+            raise ValueError("Returns must be finite.")
+        self._sum += r
+        self._cross += np.outer(r, r)
+        self._buffer.append(r)
+        if len(self._buffer) > self.window:
+            old = self._buffer.popleft()
+            self._sum -= old
+            self._cross -= np.outer(old, old)
 
+    @property
+    def n_obs(self) -> int:
+        return len(self._buffer)
 
+    @property
+    def covariance(self) -> Optional[np.ndarray]:
+        n = self.n_obs
+        if n < 2:
+            return None
+        return (self._cross - np.outer(self._sum, self._sum) / n) / (n - 1)
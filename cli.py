@@ -50,32 +50,37 @@ def build_parser() -> argparse.ArgumentParser:
 
 def _pretty_print_summary(df: pd.DataFrame) -> None:
     table = Table(show_header=True, header_style="bold magenta")
-    for col in [
-        "ticker",
-        "quantity",
-        "avg_cost",
-        "latest_price",
-        "market_value",
-        "cost_basis",
-        "unrealized_pl",
-        "unrealized_pl_pct",
-        "weight_pct",
-    ]:
-        if col in df.columns:
-            table.add_column(col)
-
-    for _, row in df.sort_values("market_value", ascending=False).iterrows():
-        values = []
-        for col in table.columns:
-            val = row.get(col.header)
-            if isinstance(val, float):
-                if "pct" in col.header:
-                    values.append(f"{val:,.2f}%")
-                else:
-                    values.append(f"{val:,.2f}")
-            else:
-                values.append(str(val))
-        table.add_row(*values)
+    cols = [
+        col
+        for col in [
+            "ticker",
+            "quantity",
+            "avg_cost",
+            "latest_price",
+            "market_value",
+            "cost_basis",
+            "unrealized_pl",
+            "unrealized_pl_pct",
+            "weight_pct",
+        ]
+        if col in df.columns
+    ]
+    for col in cols:
+        table.add_column(col)
+
+    # Format each column once instead of per cell
+    sorted_df = df.sort_values("market_value", ascending=False)
+    formatted = {}
+    for col in cols:
+        series = sorted_df[col]
+        if pd.api.types.is_float_dtype(series):
+            fmt = "{:,.2f}%" if "pct" in col else "{:,.2f}"
+            formatted[col] = series.map(fmt.format).to_numpy()
+        else:
+            formatted[col] = series.astype(str).to_numpy()
+
+    for i in range(len(sorted_df)):
+        table.add_row(*[formatted[col][i] for col in cols])
     console.print(table)
 
 
@@ -86,14 +91,25 @@ def main(argv: list[str] | None = None) -> None:
     portfolio_df = load_portfolio_csv(args.file)
 
     # Fetch latest prices and metadata
-    tickers = portfolio_df["ticker"].astype(str).str.upper().tolist()
+    portfolio_df["ticker"] = portfolio_df["ticker"].str.upper()
+    tickers = portfolio_df["ticker"].tolist()
     latest_prices = fetch_latest_prices(tickers)
     info = fetch_ticker_info(tickers)
     info_map = {i.ticker: i for i in info}
 
-    portfolio_df["latest_price"] = portfolio_df["ticker"].str.upper().map(latest_prices)
-    portfolio_df["sector"] = portfolio_df["ticker"].str.upper().map(
-        lambda t: info_map.get(t).sector if info_map.get(t) else None
+    # Join prices and sectors in one pass
+    meta_df = (
+        pd.DataFrame(
+            {
+                "latest_price": pd.Series(latest_prices, dtype=float),
+                "sector": pd.Series({t: i.sector for t, i in info_map.items()}, dtype=object),
+            }
+        )
+        .rename_axis("ticker")
+        .reset_index()
+    )
+    portfolio_df = portfolio_df.drop(columns=["latest_price", "sector"], errors="ignore").merge(
+        meta_df, on="ticker", how="left"
     )
 
     portfolio = Portfolio.from_dataframe(portfolio_df)
@@ -9,12 +9,43 @@ Currently uses `yfinance` as a convenient public source for:
 
 from __future__ import annotations
 
+import hashlib
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Optional
+from datetime import datetime, time as dt_time, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+from zoneinfo import ZoneInfo
 
 import pandas as pd
 import yfinance as yf
 
+from .io_utils import HAS_PYARROW
+
+try:
+    from platformdirs import user_cache_dir
+except ImportError:  # pragma: no cover - optional dependency
+    user_cache_dir = None
+
+
+# Universes larger than this are split across concurrent yf.download calls
+HISTORY_CHUNK_THRESHOLD = 50
+# Concurrent chunk downloads; at least yfinance's own default (one per CPU)
+HISTORY_MIN_WORKERS = 16
+
+# Disk-cached history is refreshed after each US market close; intraday bars
+# change too often to be worth persisting
+MARKET_TZ = ZoneInfo("America/New_York")
+MARKET_OPEN = dt_time(9, 30)
+MARKET_CLOSE = dt_time(16, 0)
+DISK_CACHE_INTERVALS = {"1d", "5d", "1wk", "1mo", "3mo"}
+
+# Seconds a fetched ticker info entry stays valid
+INFO_CACHE_TTL = 3600
+_INFO_CACHE: Dict[str, Tuple[float, TickerInfo]] = {}
+
 
 @dataclass
 class TickerInfo:
@@ -25,6 +56,15 @@ class TickerInfo:
     long_name: Optional[str] = None
 
 
+def canonical_tickers(tickers: Iterable[str]) -> Tuple[str, ...]:
+    """
+    Deduplicate and upper-case tickers into a sorted tuple.
+
+    The stable ordering keeps cache keys and downloads independent of input order.
+    """
+    return tuple(sorted({t.upper() for t in tickers}))
+
+
 def fetch_latest_prices(tickers: Iterable[str]) -> Dict[str, float]:
     """
     Fetch the most recent close price for each ticker.
@@ -32,63 +72,179 @@ def fetch_latest_prices(tickers: Iterable[str]) -> Dict[str, float]:
     Returns a dictionary {ticker: price}.
     """
 
-    tickers = list({t.upper() for t in tickers})
+    tickers = canonical_tickers(tickers)
     if not tickers:
         return {}
 
-    data = yf.download(tickers, period="2d", interval="1d", threads=True, progress=False)
+    data = yf.download(list(tickers), period="2d", interval="1d", threads=True, progress=False)
     # Normalize to DataFrame and take the last available close for each ticker
     close = data["Close"]
     if isinstance(close, pd.Series):
-        close = close.to_frame()
+        close = close.to_frame(name=tickers[0])
+    if close.empty:
+        return {}
+
+    last = close.ffill().iloc[-1].dropna()
+    return {str(t): float(p) for t, p in last.items()}
+
+
+def _download_close(
+    tickers: Tuple[str, ...],
+    period: str,
+    interval: str,
+    threads: bool = True,
+) -> pd.DataFrame:
+    data = yf.download(
+        list(tickers),
+        period=period,
+        interval=interval,
+        auto_adjust=True,
+        threads=threads,
+        progress=False,
+    )
+    adj_close = data["Close"]
+    if isinstance(adj_close, pd.Series):
+        adj_close = adj_close.to_frame(name=tickers[0])
+    return adj_close
+
+
+def _disk_cache_path() -> Path:
+    """
+    Directory for on-disk price caches.
+    """
+    if user_cache_dir is not None:
+        return Path(user_cache_dir("portfolio_pricer"))
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "portfolio_pricer"
+
+
+def _history_cache_file(tickers: Tuple[str, ...], period: str, interval: str) -> Path:
+    tickers_hash = hashlib.sha1(",".join(tickers).encode()).hexdigest()[:16]
+    return _disk_cache_path() / f"prices_{period}_{interval}_{tickers_hash}.parquet"
+
 
-    latest: Dict[str, float] = {}
-    for t in tickers:
-        series = close[t].dropna()
-        if not series.empty:
-            latest[t] = float(series.iloc[-1])
-    return latest
+def _market_now() -> datetime:
+    return datetime.now(MARKET_TZ)
+
+
+def _last_market_close(now: datetime) -> datetime:
+    """
+    Most recent weekday close at or before ``now`` (exchange holidays are ignored).
+    """
+    close = now.replace(hour=MARKET_CLOSE.hour, minute=MARKET_CLOSE.minute, second=0, microsecond=0)
+    if now < close:
+        close -= timedelta(days=1)
+    while close.weekday() >= 5:
+        close -= timedelta(days=1)
+    return close
+
+
+def _market_is_open(now: datetime) -> bool:
+    return now.weekday() < 5 and MARKET_OPEN <= now.time() < MARKET_CLOSE
+
+
+def _read_history_cache(path: Path) -> Optional[pd.DataFrame]:
+    # A file is fresh until the next close adds a new daily bar
+    try:
+        written = datetime.fromtimestamp(path.stat().st_mtime, tz=MARKET_TZ)
+        if written < _last_market_close(_market_now()):
+            return None
+        return pd.read_parquet(path)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_history_cache(path: Path, df: pd.DataFrame) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(path)
+    except (OSError, ValueError):
+        pass
+
+
+def _is_complete(df: pd.DataFrame, tickers: Tuple[str, ...]) -> bool:
+    """
+    True if every requested ticker came back with at least one price.
+    """
+    if df.empty or not set(tickers).issubset(df.columns):
+        return False
+    return bool(df[list(tickers)].notna().any().all())
 
 
 def fetch_historical_prices(
     tickers: Iterable[str],
     period: str = "1y",
     interval: str = "1d",
+    use_disk_cache: bool = True,
 ) -> pd.DataFrame:
     """
     Fetch historical adjusted close prices for the given tickers.
 
+    Universes above HISTORY_CHUNK_THRESHOLD tickers are split into one chunk
+    per worker, and the chunks are downloaded concurrently. When PyArrow is available, daily-or-longer
+    intervals are cached as parquet files until the next market close (see
+    ``_disk_cache_path``).
+
     Returns a DataFrame indexed by date with tickers as columns.
     """
-    tickers = list({t.upper() for t in tickers})
+    tickers = canonical_tickers(tickers)
     if not tickers:
         return pd.DataFrame()
 
-    data = yf.download(
-        tickers,
-        period=period,
-        interval=interval,
-        auto_adjust=True,
-        threads=True,
-        progress=False,
-    )
-    adj_close = data["Close"]
-    if isinstance(adj_close, pd.Series):
-        adj_close = adj_close.to_frame()
-    return adj_close.dropna(how="all")
+    use_disk_cache = use_disk_cache and HAS_PYARROW and interval in DISK_CACHE_INTERVALS
+    if use_disk_cache:
+        cache_file = _history_cache_file(tickers, period, interval)
+        cached = _read_history_cache(cache_file)
+        if cached is not None:
+            return cached
+
+    if len(tickers) <= HISTORY_CHUNK_THRESHOLD:
+        adj_close = _download_close(tickers, period, interval)
+    else:
+        # Each chunk downloads serially (threads=False) and the pool provides
+        # the concurrency, so use at least as many workers as yfinance would
+        workers = min(max(HISTORY_MIN_WORKERS, os.cpu_count() or 1), len(tickers))
+        size = -(-len(tickers) // workers)
+        chunks = [tickers[i : i + size] for i in range(0, len(tickers), size)]
+        with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+            frames = list(
+                executor.map(lambda c: _download_close(c, period, interval, threads=False), chunks)
+            )
+        adj_close = pd.concat(frames, axis=1)
+        adj_close = adj_close.reindex(columns=[t for t in tickers if t in adj_close.columns])
+    adj_close = adj_close.dropna(how="all")
+    # Never persist failed or partial downloads, or bars still forming intraday
+    if use_disk_cache and not _market_is_open(_market_now()) and _is_complete(adj_close, tickers):
+        _write_history_cache(cache_file, adj_close)
+    return adj_close
+
+
+def _fetch_one_info(ticker: str) -> TickerInfo:
+    """
+    Fetch info for a single ticker.
+
+    Results are cached for INFO_CACHE_TTL seconds; empty responses are not
+    cached so a transient Yahoo failure doesn't stick.
+    """
+    hit = _INFO_CACHE.get(ticker)
+    if hit is not None and time.monotonic() - hit[0] < INFO_CACHE_TTL:
+        return hit[1]
+    info = yf.Ticker(ticker).info or {}
+    sector = info.get("sector")
+    long_name = info.get("longName") or info.get("shortName")
+    result = TickerInfo(ticker=ticker, sector=sector, long_name=long_name)
+    if sector is not None or long_name is not None:
+        _INFO_CACHE[ticker] = (time.monotonic(), result)
+    return result
 
 
 def fetch_ticker_info(tickers: Iterable[str]) -> List[TickerInfo]:
     """
     Fetch basic info (name, sector) for each ticker.
-    """
-    infos: List[TickerInfo] = []
-    for t in {t.upper() for t in tickers}:
-        tk = yf.Ticker(t)
-        info = tk.info or {}
-        sector = info.get("sector")
-        long_name = info.get("longName") or info.get("shortName")
-        infos.append(TickerInfo(ticker=t, sector=sector, long_name=long_name))
-    return infos
-
 
+    Requests are issued concurrently since each one is a blocking HTTP call.
+    """
+    tickers = canonical_tickers(tickers)
+    if not tickers:
+        return []
+    with ThreadPoolExecutor(max_workers=min(16, len(tickers))) as executor:
+        return list(executor.map(_fetch_one_info, tickers))
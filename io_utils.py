@@ -5,29 +5,51 @@ Simple CSV input/output helpers for portfolios.
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Union
+from typing import Dict, Union
 
 import pandas as pd
 
+try:
+    import pyarrow  # noqa: F401
+except ImportError:  # pragma: no cover - optional dependency
+    HAS_PYARROW = False
+else:
+    HAS_PYARROW = True
+
 
 PathLike = Union[str, Path]
 
 
 REQUIRED_COLUMNS = ["ticker", "quantity", "avg_cost"]
 
+# Arrow-backed strings keep tickers in a contiguous buffer with native .str kernels
+TICKER_DTYPE = "string[pyarrow]" if HAS_PYARROW else "string"
+
+REQUIRED_DTYPES: Dict[str, str] = {
+    "ticker": TICKER_DTYPE,
+    "quantity": "float64",
+    "avg_cost": "float64",
+}
 
-def load_portfolio_csv(path: PathLike) -> pd.DataFrame:
+
+def load_portfolio_csv(path: PathLike, engine: str = "pyarrow") -> pd.DataFrame:
     """
     Load a portfolio CSV with at least:
     - ticker
     - quantity
     - avg_cost
+
+    Uses the multi-threaded PyArrow CSV reader when available, falling back
+    to the default C engine otherwise.
     """
     path = Path(path)
-    df = pd.read_csv(path)
+    if engine == "pyarrow" and not HAS_PYARROW:
+        engine = "c"
+    df = pd.read_csv(path, engine=engine, dtype=REQUIRED_DTYPES)
     missing = [c for c in REQUIRED_COLUMNS if c not in df.columns]
     if missing:
         raise ValueError(f"Portfolio CSV is missing required columns: {missing}")
+    df["ticker"] = df["ticker"].astype(TICKER_DTYPE)
     return df
 
 
@@ -5,14 +5,22 @@ Core portfolio data structures: Position and Portfolio.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, Iterable, List, Optional
+from functools import cached_property
+from itertools import repeat
+from typing import Iterable, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Position:
-    """Represents a single holding in a portfolio."""
+    """
+    Represents a single holding in a portfolio.
+
+    Derived analytics are computed once at construction; the instance is frozen
+    so they can never go stale.
+    """
 
     ticker: str
     quantity: float
@@ -20,34 +28,58 @@ class Position:
     latest_price: Optional[float] = None
     sector: Optional[str] = None
 
-    @property
-    def cost_basis(self) -> float:
-        return self.quantity * self.avg_cost
+    cost_basis: float = field(init=False, repr=False, compare=False)
+    market_value: Optional[float] = field(init=False, repr=False, compare=False)
+    unrealized_pl: Optional[float] = field(init=False, repr=False, compare=False)
+    unrealized_pl_pct: Optional[float] = field(init=False, repr=False, compare=False)
 
-    @property
-    def market_value(self) -> Optional[float]:
+    def __post_init__(self) -> None:
+        cost_basis = self.quantity * self.avg_cost
         if self.latest_price is None:
-            return None
-        return self.quantity * self.latest_price
+            market_value = unrealized_pl = unrealized_pl_pct = None
+        else:
+            market_value = self.quantity * self.latest_price
+            unrealized_pl = market_value - cost_basis
+            unrealized_pl_pct = (unrealized_pl / cost_basis) * 100.0 if cost_basis != 0 else None
+        object.__setattr__(self, "cost_basis", cost_basis)
+        object.__setattr__(self, "market_value", market_value)
+        object.__setattr__(self, "unrealized_pl", unrealized_pl)
+        object.__setattr__(self, "unrealized_pl_pct", unrealized_pl_pct)
+
+
+@dataclass(frozen=True)
+class Portfolio:
+    """
+    A collection of positions plus helper analytics.
 
-    @property
-    def unrealized_pl(self) -> Optional[float]:
-        if self.market_value is None:
-            return None
-        return self.market_value - self.cost_basis
-
-    @property
-    def unrealized_pl_pct(self) -> Optional[float]:
-        if self.unrealized_pl is None or self.cost_basis == 0:
-            return None
-        return (self.unrealized_pl / self.cost_basis) * 100.0
+    Positions are stored as an immutable tuple so the numeric arrays behind the
+    totals can be built once and reused.
+    """
 
+    positions: Tuple[Position, ...] = ()
 
-@dataclass
-class Portfolio:
-    """A collection of positions plus helper analytics."""
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "positions", tuple(self.positions))
 
-    positions: List[Position] = field(default_factory=list)
+    @cached_property
+    def _arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Ticker, quantity, average cost, latest price (NaN if unknown) and sector
+        per position, filled in a single pass into pre-allocated typed arrays.
+        """
+        n = len(self.positions)
+        tickers = np.empty(n, dtype=object)
+        quantity = np.empty(n)
+        avg_cost = np.empty(n)
+        latest_price = np.empty(n)
+        sectors = np.empty(n, dtype=object)
+        for i, p in enumerate(self.positions):
+            tickers[i] = p.ticker
+            quantity[i] = p.quantity
+            avg_cost[i] = p.avg_cost
+            latest_price[i] = np.nan if p.latest_price is None else p.latest_price
+            sectors[i] = p.sector
+        return tickers, quantity, avg_cost, latest_price, sectors
 
     @classmethod
     def from_dataframe(cls, df: pd.DataFrame) -> "Portfolio":
@@ -58,57 +90,74 @@ class Portfolio:
         - avg_cost
         (optional) latest_price, sector
         """
-        positions: List[Position] = []
-        for _, row in df.iterrows():
-            positions.append(
-                Position(
-                    ticker=str(row["ticker"]).upper(),
-                    quantity=float(row["quantity"]),
-                    avg_cost=float(row["avg_cost"]),
-                    latest_price=float(row["latest_price"])
-                    if "latest_price" in df.columns and pd.notna(row["latest_price"])
-                    else None,
-                    sector=str(row["sector"]) if "sector" in df.columns and pd.notna(row["sector"]) else None,
-                )
+        tickers = df["ticker"].astype(str).str.upper().to_numpy()
+        quantities = df["quantity"].astype(float).to_numpy()
+        avg_costs = df["avg_cost"].astype(float).to_numpy()
+
+        # Resolve optional columns once, mapping missing values to None
+        if "latest_price" in df.columns:
+            prices = df["latest_price"].astype(float)
+            latest_prices: Iterable[Optional[float]] = np.where(
+                prices.notna(), prices.to_numpy(dtype=object), None
+            )
+        else:
+            latest_prices = repeat(None)
+        if "sector" in df.columns:
+            sectors: Iterable[Optional[str]] = np.where(
+                df["sector"].notna(), df["sector"].astype(str).to_numpy(dtype=object), None
             )
+        else:
+            sectors = repeat(None)
+
+        positions = [
+            Position(ticker=t, quantity=float(q), avg_cost=float(c), latest_price=lp, sector=s)
+            for t, q, c, lp, s in zip(tickers, quantities, avg_costs, latest_prices, sectors)
+        ]
         return cls(positions=positions)
 
     def to_dataframe(self) -> pd.DataFrame:
         """
         Represent the portfolio as a DataFrame with analytics columns.
         """
-        rows: List[Dict] = []
-        for p in self.positions:
-            row = {
-                "ticker": p.ticker,
-                "quantity": p.quantity,
-                "avg_cost": p.avg_cost,
-                "cost_basis": p.cost_basis,
-                "latest_price": p.latest_price,
-                "market_value": p.market_value,
-                "unrealized_pl": p.unrealized_pl,
-                "unrealized_pl_pct": p.unrealized_pl_pct,
-                "sector": p.sector,
+        tickers, quantity, avg_cost, latest_price, sectors = self._arrays
+
+        cost_basis = quantity * avg_cost
+        market_value = quantity * latest_price
+        unrealized_pl = market_value - cost_basis
+        with np.errstate(divide="ignore", invalid="ignore"):
+            unrealized_pl_pct = np.where(cost_basis != 0, unrealized_pl / cost_basis * 100.0, np.nan)
+
+        df = pd.DataFrame(
+            {
+                "ticker": tickers,
+                "quantity": quantity,
+                "avg_cost": avg_cost,
+                "cost_basis": cost_basis,
+                "latest_price": latest_price,
+                "market_value": market_value,
+                "unrealized_pl": unrealized_pl,
+                "unrealized_pl_pct": unrealized_pl_pct,
+                "sector": sectors,
             }
-            rows.append(row)
-        df = pd.DataFrame(rows)
+        )
         # Drop analytics columns if prices are missing entirely
-        if df["market_value"].notna().any():
-            total_value = df["market_value"].fillna(0.0).sum()
+        if not np.isnan(market_value).all():
+            total_value = np.nansum(market_value)
             if total_value > 0:
-                df["weight_pct"] = (df["market_value"].fillna(0.0) / total_value) * 100.0
+                df["weight_pct"] = np.nan_to_num(market_value) / total_value * 100.0
         return df
 
     @property
     def total_cost_basis(self) -> float:
-        return sum(p.cost_basis for p in self.positions)
+        _, quantity, avg_cost, _, _ = self._arrays
+        return float((quantity * avg_cost).sum())
 
     @property
     def total_market_value(self) -> Optional[float]:
-        values = [p.market_value for p in self.positions if p.market_value is not None]
-        if not values:
+        _, quantity, _, latest_price, _ = self._arrays
+        if np.isnan(latest_price).all():
             return None
-        return float(sum(values))
+        return float(np.nansum(quantity * latest_price))
 
     @property
     def total_unrealized_pl(self) -> Optional[float]:
@@ -14,7 +14,31 @@ import streamlit as st
 
 from . import Portfolio
 from .analytics import annualized_volatility, compute_daily_returns, portfolio_volatility
-from .data_fetch import fetch_historical_prices, fetch_latest_prices, fetch_ticker_info
+from .data_fetch import (
+    TickerInfo,
+    canonical_tickers,
+    fetch_historical_prices,
+    fetch_latest_prices,
+    fetch_ticker_info,
+)
+from .io_utils import TICKER_DTYPE
+
+
+# Cached wrappers so widget interactions don't re-hit Yahoo Finance.
+# Tickers are passed as tuples to keep the cache keys hashable.
+@st.cache_data(ttl=300)
+def _cached_latest_prices(tickers: tuple[str, ...]) -> dict[str, float]:
+    return fetch_latest_prices(list(tickers))
+
+
+@st.cache_data(ttl=300)
+def _cached_historical_prices(tickers: tuple[str, ...], period: str, interval: str = "1d") -> pd.DataFrame:
+    return fetch_historical_prices(list(tickers), period=period, interval=interval)
+
+
+@st.cache_data(ttl=3600)
+def _cached_ticker_info(tickers: tuple[str, ...]) -> list[TickerInfo]:
+    return fetch_ticker_info(list(tickers))
 
 
 def main() -> None:
@@ -38,15 +62,26 @@ def main() -> None:
         st.error("CSV must contain at least: ticker, quantity, avg_cost.")
         return
 
-    tickers = portfolio_df["ticker"].astype(str).str.upper().tolist()
-    latest_prices = fetch_latest_prices(tickers)
-    info = fetch_ticker_info(tickers)
+    portfolio_df["ticker"] = portfolio_df["ticker"].astype(TICKER_DTYPE).str.upper()
+    tickers = portfolio_df["ticker"].tolist()
+    ticker_key = canonical_tickers(tickers)
+    latest_prices = _cached_latest_prices(ticker_key)
+    info = _cached_ticker_info(ticker_key)
     info_map = {i.ticker: i for i in info}
 
-    portfolio_df["ticker"] = portfolio_df["ticker"].astype(str).str.upper()
-    portfolio_df["latest_price"] = portfolio_df["ticker"].map(latest_prices)
-    portfolio_df["sector"] = portfolio_df["ticker"].map(
-        lambda t: info_map.get(t).sector if info_map.get(t) else None
+    # Join prices and sectors in one pass
+    meta_df = (
+        pd.DataFrame(
+            {
+                "latest_price": pd.Series(latest_prices, dtype=float),
+                "sector": pd.Series({t: i.sector for t, i in info_map.items()}, dtype=object),
+            }
+        )
+        .rename_axis("ticker")
+        .reset_index()
+    )
+    portfolio_df = portfolio_df.drop(columns=["latest_price", "sector"], errors="ignore").merge(
+        meta_df, on="ticker", how="left"
     )
 
     portfolio = Portfolio.from_dataframe(portfolio_df)
@@ -59,7 +94,7 @@ def main() -> None:
     with col2:
         show_sector = st.checkbox("Group summary by sector", value=True)
 
-    price_history = fetch_historical_prices(tickers, period=risk_period)
+    price_history = _cached_historical_prices(ticker_key, risk_period)
     returns = compute_daily_returns(price_history)
     vol = annualized_volatility(returns)
     if not vol.empty:
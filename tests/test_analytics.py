@@ -1,9 +1,13 @@
 import numpy as np
 import pandas as pd
+import pytest
 
 from portfolio_pricer.analytics import (
+    RollingCovariance,
+    _cov_posthoc,
     annualized_volatility,
     compute_daily_returns,
+    factor_covariance,
     portfolio_volatility,
 )
 
@@ -25,6 +29,24 @@ def test_compute_daily_returns_and_volatility():
     assert (vol > 0).all()
 
 
+def test_compute_daily_returns_unsorted_and_ragged():
+    dates = pd.date_range("2024-01-01", periods=5)
+    prices = pd.DataFrame(
+        {
+            "AAA": [100.0, np.nan, 110.0, 121.0, np.nan],
+            "BBB": [50.0, np.nan, np.nan, 55.0, 60.5],
+        },
+        index=dates,
+    )
+    rets = compute_daily_returns(prices.iloc[::-1])
+    # Day 2 has no prices and day 3 has no valid pair, so both rows are dropped
+    assert list(rets.index) == [dates[3], dates[4]]
+    assert abs(rets.loc[dates[3], "AAA"] - 0.1) < 1e-12
+    assert np.isnan(rets.loc[dates[3], "BBB"])
+    assert np.isnan(rets.loc[dates[4], "AAA"])
+    assert abs(rets.loc[dates[4], "BBB"] - 0.1) < 1e-12
+
+
 def test_portfolio_volatility_dimensions():
     prices = pd.DataFrame(
         {
@@ -39,3 +61,62 @@ def test_portfolio_volatility_dimensions():
     assert vol > 0
 
 
+def test_portfolio_volatility_matches_covariance_formula():
+    rng = np.random.default_rng(0)
+    rets = pd.DataFrame(rng.normal(0.0, 0.01, size=(100, 3)), columns=["AAA", "BBB", "CCC"])
+    w = np.array([0.5, 0.3, 0.2])
+    expected = float(np.sqrt(w @ rets.cov().values @ w) * np.sqrt(252))
+    # Returns are reduced in float32
+    assert abs(portfolio_volatility(rets, w) - expected) < 1e-6 * expected
+
+
+def test_portfolio_volatility_with_gap_uses_pairwise_covariance():
+    rets = pd.DataFrame(
+        {
+            "AAA": [0.010, -0.004, 0.006, np.nan, 0.002, -0.008],
+            "BBB": [0.003, 0.007, -0.005, 0.004, -0.002, 0.001],
+        }
+    )
+    w = np.array([0.6, 0.4])
+    expected = float(np.sqrt(w @ rets.cov().values @ w) * np.sqrt(252))
+    assert abs(portfolio_volatility(rets, w) - expected) < 1e-12
+
+
+def test_cov_posthoc_matches_numpy():
+    rng = np.random.default_rng(1)
+    R = rng.normal(0.0, 0.01, size=(50, 4))
+    assert np.allclose(_cov_posthoc(R), np.cov(R, rowvar=False))
+
+
+def test_rolling_covariance_matches_window():
+    rng = np.random.default_rng(2)
+    rets = pd.DataFrame(rng.normal(0.0, 0.01, size=(40, 3)), columns=["AAA", "BBB", "CCC"])
+    rc = RollingCovariance.from_returns(rets.iloc[:30], window=20)
+    for r in rets.iloc[30:].to_numpy():
+        rc.update(r)
+    assert rc.n_obs == 20
+    assert np.allclose(rc.covariance, rets.iloc[-20:].cov().values)
+
+    with pytest.raises(ValueError):
+        rc.update([0.01, np.nan, 0.0])
+    with pytest.raises(ValueError):
+        rc.update([0.01, 0.02])
+    assert rc.n_obs == 20
+    assert np.allclose(rc.covariance, rets.iloc[-20:].cov().values)
+
+
+def test_factor_volatility_close_to_sample():
+    rng = np.random.default_rng(3)
+    market = pd.Series(rng.normal(0.0, 0.01, size=500))
+    betas = np.array([0.8, 1.0, 1.2])
+    rets = pd.DataFrame(
+        np.outer(market, betas) + rng.normal(0.0, 0.005, size=(500, 3)),
+        columns=["AAA", "BBB", "CCC"],
+    )
+    beta, _, _ = factor_covariance(rets, market)
+    assert np.allclose(beta.values, betas, atol=0.1)
+
+    w = np.array([0.5, 0.3, 0.2])
+    sample = portfolio_volatility(rets, w)
+    factor = portfolio_volatility(rets, w, method="factor", market_returns=market)
+    assert abs(factor - sample) / sample < 0.05
@@ -0,0 +1,112 @@
+import os
+import threading
+from datetime import datetime, timedelta
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from portfolio_pricer import data_fetch
+
+
+def test_ticker_info_empty_response_is_not_cached(monkeypatch):
+    monkeypatch.setattr(data_fetch, "_INFO_CACHE", {})
+    responses = iter([{}, {"sector": "Technology", "longName": "Apple Inc."}])
+    with mock.patch.object(data_fetch.yf, "Ticker") as ticker:
+        type(ticker.return_value).info = mock.PropertyMock(side_effect=lambda: next(responses))
+        first = data_fetch.fetch_ticker_info(["aapl"])
+        second = data_fetch.fetch_ticker_info(["aapl"])
+        third = data_fetch.fetch_ticker_info(["aapl"])
+
+    assert first[0].sector is None
+    assert second[0].sector == "Technology"
+    assert third[0].sector == "Technology"
+    assert ticker.call_count == 2
+
+
+def _download_frame(tickers, n_rows):
+    cols = pd.MultiIndex.from_product([["Close", "Open"], tickers], names=["Price", "Ticker"])
+    index = pd.date_range("2024-01-01", periods=n_rows)
+    values = np.arange(1, n_rows * len(cols) + 1, dtype=float).reshape(n_rows, len(cols))
+    return pd.DataFrame(values, index=index, columns=cols)
+
+
+def test_latest_prices_when_every_ticker_fails():
+    with mock.patch.object(data_fetch.yf, "download", return_value=_download_frame(["AAPL", "MSFT"], 0)):
+        assert data_fetch.fetch_latest_prices(["AAPL", "MSFT"]) == {}
+
+
+def test_historical_prices_downloads_large_universes_in_chunks(monkeypatch):
+    monkeypatch.setattr(data_fetch, "HISTORY_MIN_WORKERS", 4)
+    monkeypatch.setattr(data_fetch.os, "cpu_count", lambda: 4)
+    tickers = [f"T{i:03d}" for i in range(120)]
+    calls = []
+    # Every chunk must be in flight at once for all of them to pass the barrier
+    barrier = threading.Barrier(4, timeout=5)
+
+    def fake_download(chunk, **kwargs):
+        calls.append((list(chunk), kwargs["threads"]))
+        barrier.wait()
+        return _download_frame(chunk, 3)
+
+    with mock.patch.object(data_fetch.yf, "download", side_effect=fake_download):
+        prices = data_fetch.fetch_historical_prices(reversed(tickers), use_disk_cache=False)
+
+    assert sorted(len(chunk) for chunk, _ in calls) == [30, 30, 30, 30]
+    assert not any(threads for _, threads in calls)
+    assert list(prices.columns) == tickers
+
+
+def _patch_history_cache(monkeypatch, tmp_path, now):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.setattr(data_fetch, "_market_now", lambda: now)
+
+
+@pytest.mark.skipif(not data_fetch.HAS_PYARROW, reason="disk cache requires pyarrow")
+def test_history_cache_skips_failed_downloads(monkeypatch, tmp_path):
+    _patch_history_cache(monkeypatch, tmp_path, datetime(2024, 6, 1, 12, 0, tzinfo=data_fetch.MARKET_TZ))
+    responses = [
+        _download_frame(["AAPL", "MSFT"], 0),
+        _download_frame(["AAPL", "MSFT"], 3),
+    ]
+    with mock.patch.object(data_fetch.yf, "download", side_effect=responses) as download:
+        failed = data_fetch.fetch_historical_prices(["AAPL", "MSFT"])
+        fetched = data_fetch.fetch_historical_prices(["AAPL", "MSFT"])
+        cached = data_fetch.fetch_historical_prices(["MSFT", "AAPL"])
+
+    assert failed.empty
+    assert download.call_count == 2
+    assert fetched.shape == (3, 2)
+    pd.testing.assert_frame_equal(cached, fetched, check_freq=False)
+
+
+@pytest.mark.skipif(not data_fetch.HAS_PYARROW, reason="disk cache requires pyarrow")
+def test_history_cache_expires_at_market_close(monkeypatch, tmp_path):
+    monday_afternoon = datetime(2024, 6, 3, 15, 0, tzinfo=data_fetch.MARKET_TZ)
+    _patch_history_cache(monkeypatch, tmp_path, datetime(2024, 6, 1, 12, 0, tzinfo=data_fetch.MARKET_TZ))
+    with mock.patch.object(data_fetch.yf, "download", return_value=_download_frame(["AAPL"], 3)) as download:
+        data_fetch.fetch_historical_prices(["AAPL"])
+        (cache_file,) = (tmp_path / "portfolio_pricer").glob("*.parquet")
+        written = monday_afternoon.timestamp()
+        os.utime(cache_file, (written, written))
+
+        # Still before Monday's close: the file is fresh
+        monkeypatch.setattr(data_fetch, "_market_now", lambda: monday_afternoon + timedelta(minutes=30))
+        data_fetch.fetch_historical_prices(["AAPL"])
+        assert download.call_count == 1
+
+        # After the close a new daily bar exists, so the file is stale
+        monkeypatch.setattr(data_fetch, "_market_now", lambda: monday_afternoon + timedelta(hours=2))
+        data_fetch.fetch_historical_prices(["AAPL"])
+        assert download.call_count == 2
+
+
+def test_history_cache_ignores_intraday_intervals(monkeypatch, tmp_path):
+    _patch_history_cache(monkeypatch, tmp_path, datetime(2024, 6, 1, 12, 0, tzinfo=data_fetch.MARKET_TZ))
+    with mock.patch.object(data_fetch.yf, "download", return_value=_download_frame(["AAPL"], 3)) as download:
+        data_fetch.fetch_historical_prices(["AAPL"], period="5d", interval="1h")
+        data_fetch.fetch_historical_prices(["AAPL"], period="5d", interval="1h")
+
+    assert download.call_count == 2
+    assert not list(tmp_path.rglob("*.parquet"))
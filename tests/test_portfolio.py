@@ -1,6 +1,6 @@
 import pandas as pd
 
-from portfolio_pricer import Portfolio
+from portfolio_pricer import Portfolio, Position
 
 
 def test_portfolio_basic_pl_and_weights():
@@ -39,3 +39,13 @@ def test_portfolio_basic_pl_and_weights():
     assert abs(weights["BBB"] - 50.0) < 1e-6
 
 
+def test_position_analytics_without_price():
+    p = Position(ticker="AAA", quantity=10, avg_cost=100.0)
+    assert p.cost_basis == 1000.0
+    assert p.market_value is None
+    assert p.unrealized_pl is None
+    assert p.unrealized_pl_pct is None
+
+    priced = Position(ticker="AAA", quantity=10, avg_cost=100.0, latest_price=120.0)
+    assert priced.unrealized_pl == 200.0
+    assert abs(priced.unrealized_pl_pct - 20.0) < 1e-9